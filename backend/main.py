@@ -5,17 +5,28 @@ Enhanced version of your original FastAPI code with database integration
 
 import re
 import asyncio
+import io
+import json
 import os
+import string
 import gzip
-import json
-import time
 import sqlite3
+import queue
+import threading
+from collections import Counter, OrderedDict
+from contextlib import asynccontextmanager, contextmanager
+from functools import lru_cache
+from hashlib import blake2b
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
 from typing import List, Dict, Optional
 from uuid import uuid4
 
-from fastapi import FastAPI, HTTPException, Body
+import orjson
+from fastapi import FastAPI, HTTPException, Body, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 from pydantic import BaseModel
 
 # Load environment variables from .env.local
@@ -31,6 +42,26 @@ except ImportError:
     GEMINI_AVAILABLE = False
     print("Google Generative AI not installed. Install with: pip install google-generativeai")
 
+# Optional RE2 engine for the extraction patterns (linear-time, no backtracking).
+# Enable with EXTRACTIFY_REGEX_ENGINE=re2 after: pip install google-re2
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+USE_RE2 = os.getenv("EXTRACTIFY_REGEX_ENGINE", "re").lower() == "re2"
+if USE_RE2 and not RE2_AVAILABLE:
+    print("RE2 requested but not installed. Install with: pip install google-re2")
+    USE_RE2 = False
+
+# Optional streaming JSON parser for large ABCD uploads (pip install ijson)
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
 # Pydantic Models
 class ConversationCreate(BaseModel):
     title: str
@@ -64,11 +95,23 @@ class ExtractResponse(BaseModel):
     orderId: str
     metadata: dict  # Changed from Dict[str, any] to dict
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start up and shut down the backend (the steps are defined further down)"""
+    try:
+        init_backend()
+        yield
+    finally:
+        shutdown_regex_pool()
+        close_db_connections()
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Extractify Backend",
     description="AI-powered field extraction from conversations with hybrid regex+LLM approach",
-    version="2.0.0"
+    version="2.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # CORS middleware
@@ -83,11 +126,28 @@ app.add_middleware(
 # Database setup
 DATABASE_PATH = "data/extractify_fastapi.db"
 
+# Per-connection settings: fewer fsyncs per commit, bigger page cache, and
+# waiting on a busy writer instead of failing. WAL mode itself is persistent
+# and is switched on once in init_database().
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA busy_timeout=5000",
+)
+
+def apply_connection_pragmas(conn: sqlite3.Connection):
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+
 def init_database():
     """Initialize SQLite database with required tables"""
     os.makedirs("data", exist_ok=True)
     
     conn = sqlite3.connect(DATABASE_PATH)
+    conn.execute("PRAGMA journal_mode=WAL")
+    apply_connection_pragmas(conn)
     cursor = conn.cursor()
     
     # Conversations table
@@ -118,11 +178,115 @@ def init_database():
         )
     """)
     
+    # Indexes for the conversation list (join on conversationId, newest first)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_ef_conv ON extracted_fields(conversationId)")
+    # Ascending on purpose: scanned backwards it yields (createdAt DESC, rowid DESC),
+    # the list order, with no sort step. Databases created with the earlier
+    # DESC declaration get the index rebuilt once.
+    existing = cursor.execute("SELECT sql FROM sqlite_master WHERE type = 'index' AND name = 'idx_conv_created'").fetchone()
+    if existing and "DESC" in existing[0].upper():
+        cursor.execute("DROP INDEX idx_conv_created")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_conv_created ON conversations(createdAt)")
+    
     conn.commit()
     conn.close()
 
-# Initialize database on startup
-init_database()
+# Precompiled extraction patterns.
+# Compiled once at import so the extractors skip the re module's pattern cache
+# lookup on every call (they run once per conversation in bulk extraction).
+def _compile(pattern: str, flags: int = 0):
+    """Compile an extraction pattern with the configured regex engine"""
+    if USE_RE2:
+        # RE2 takes flags inline; its \d, \w and \b are ASCII-only
+        inline = ""
+        if flags & re.IGNORECASE:
+            inline += "i"
+        if flags & re.MULTILINE:
+            inline += "m"
+        return re2.compile(f"(?{inline}){pattern}" if inline else pattern)
+    # No re.ASCII: \w must keep matching accented letters, or an address like
+    # jürgen.müller@example.de would be cut down to ller@example.de
+    return re.compile(pattern, flags)
+
+_NAME_PATTERNS = [
+    _compile(p, re.IGNORECASE | re.MULTILINE) for p in (
+        # ("my name is" is covered by "name is", which captures the same name)
+        r"(?:name(?:'s| is)|i(?:'m| am)|this is)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)",  # "My name is John Smith"
+        r"(?:call me|it'?s)\s+([A-Z][a-z]+)",  # "Call me John"
+        r"^h(?:i|ello|ey)[,!]?\s+(?:this is\s+)?([A-Z][a-z]+)",  # "Hi, this is John"
+        r"(?:customer|user|caller):\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)",  # "Customer: John Smith"
+    )
+]
+
+# Start only at the beginning of a run: otherwise a long run that never reaches
+# an "@" is rescanned from every offset (quadratic). RE2 has no lookbehind but
+# never backtracks, and the leftmost match begins a run either way.
+# RE2's \w is ASCII-only, so it spells out the Unicode letters and numbers
+# that the stdlib's \w covers.
+_EMAIL_RE = _compile(r'[\pL\pN_\.-]+@[\pL\pN_\.-]+' if USE_RE2 else r'(?<![\w\.-])[\w\.-]+@[\w\.-]+')
+
+# Each phone pattern captures the 3-3-4 digit groups
+_PHONE_RES = (
+    # Format with parentheses: (003) 941-7614
+    _compile(r'\((\d{3})\)\s*(\d{3})[-.\s]?(\d{4})'),
+    # Format with dashes: 116-048-7515
+    _compile(r'\b(\d{3})-(\d{3})-(\d{4})\b'),
+    # Format with dots: 555.123.4567
+    _compile(r'\b(\d{3})\.(\d{3})\.(\d{4})\b'),
+    # Format with spaces: 555 123 4567
+    _compile(r'\b(\d{3})\s(\d{3})\s(\d{4})\b'),
+)
+_ORDER_CTX_RE = _compile(r'order\s*(?:id|number|#|:)')
+_PHONE_OR_NUMBER_CTX_RE = _compile(r'phone|call|contact|number')
+_PHONE_CTX_RE = _compile(r'phone|call|contact|reach|mobile|cell')
+
+# "zip code 12345", "zip: 12345", "zip is 12345" or "zip 12345"
+_EXPLICIT_ZIP_RES = (
+    _compile(r'zip\s*(?:(?:code|is|:)\s*)?(\d{5}(?:-\d{4})?)', re.IGNORECASE),
+)
+_ZIP_PLUS4_RE = _compile(r'\b(\d{5}-\d{4})\b')
+_ADDRESS_ZIP_RE = _compile(
+    # (street|ave|avenue|road|rd|drive|dr|blvd|boulevard|way|ln|lane|st|circle), then
+    # two comma-separated parts; [^,] already spans whitespace, so no \s+/\s* is
+    # needed in front of it to backtrack against
+    r'(?:st(?:reet)?|ave(?:nue)?|r(?:oa)?d|dr(?:ive)?|b(?:lvd|oulevard)|way|l(?:n|ane)|circle)\s[^,]*,[^,]*,\s*[A-Z]{2}\s+(\d{5})',
+    re.IGNORECASE,
+)
+_ZIP5_RE = _compile(r'\b(\d{5})\b')
+_FIVE_DIGITS_RE = _compile(r'\d{5}')
+_PAREN_AREA_CODE_RE = _compile(r'\(\d{3}\)')
+_ORDER_LABEL_RE = _compile(r'order\s+(?:id|number|#)')
+_LONG_NUMBER_RE = _compile(r'\d{6,}')
+
+_ORDER_ID_PATTERNS = tuple(
+    _compile(p, re.IGNORECASE) for p in (
+        r'(?:order\s+id\.?\s*(?:it\s+is|is|:)\s*)(\d{6,})',  # "order ID. It is 1012809669" or "order id: 12345" (6+ digits)
+        r'(?:order\s+id\.?\s*(?::\s*)?)(\d{6,})',  # "order id: 12345" or "order id 12345" (6+ digits)
+        r'(?:order\s+number\.?\s*(?:(?:it\s+is|is|:)\s*)?)(\d{6,})',  # "order number: 12345" or "order number 12345"
+        r'(?:order\s+#\s*)(\d{6,})',  # "order # 12345"
+        r'(?:order\s+)(\d{6,})',  # "order 123456" format (6+ digits)
+    )
+)
+_ACCOUNT_ID_RE = _compile(r'[A-Za-z]\d{6,}|\d{6,}[A-Za-z]')
+_ORDER_LABEL_ANYCASE_RE = _compile(r'order\s+(?:id|number|#)', re.IGNORECASE)
+_STANDALONE_LONG_NUMBER_RE = _compile(r'\b(\d{6,})\b')
+_NINE_PLUS_DIGITS_RE = _compile(r'\b(\d{9,})\b')
+_PHONE_SHAPE_RE = _compile(r'\d{3}[-.\s]\d{3}[-.\s]\d{4}')
+
+# Combined anchor scan used by regex_extract_fields, dispatched on lastgroup.
+# Alternatives start with disjoint characters, so no anchor hides another.
+_ANCHOR_RE = _compile(r'(?P<at>@)|(?P<digits>\d{4,})|(?P<order>order)|(?P<zip>zip)', re.IGNORECASE)
+
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+def _lower_keeping_offsets(text_str: str) -> str:
+    """Lowercase once per call so context windows can be checked in place"""
+    lower = text_str.lower()
+    if len(lower) != len(text_str):
+        # A few characters (e.g. U+0130) lowercase to two; the context keywords
+        # are ASCII, so lowercasing ASCII letters only keeps offsets aligned
+        lower = text_str.translate(_ASCII_LOWER)
+    return lower
 
 # Enhanced Regex Extraction Functions
 def extract_customer_name(text):
@@ -141,22 +305,18 @@ def extract_customer_name(text):
     
     text_str = str(text)
     
-    # Patterns to find customer names
-    name_patterns = [
-        r"(?:my name is|i'm|i am|this is|name's|name is)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)",  # "My name is John Smith"
-        r"(?:call me|it's|its)\s+([A-Z][a-z]+)",  # "Call me John"
-        r"^(?:hi|hello|hey)[,!]?\s+(?:this is\s+)?([A-Z][a-z]+)",  # "Hi, this is John"
-        r"(?:customer|user|caller):\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)",  # "Customer: John Smith"
-    ]
-    
-    for pattern in name_patterns:
-        match = re.search(pattern, text_str, re.IGNORECASE | re.MULTILINE)
+    for pattern in _NAME_PATTERNS:
+        match = pattern.search(text_str)
         if match:
-            name = match.group(1).strip()
-            # Capitalize properly
-            name = ' '.join(word.capitalize() for word in name.split())
-            # Validate it looks like a name (not too long, no numbers)
-            if len(name) <= 30 and not re.search(r'\d', name):
+            # The group is [A-Za-z] letters (which, case-insensitively, also take
+            # İ, ı, ſ and the Kelvin sign) and whitespace, so there are never
+            # digits to reject; just normalize spacing and capitalization.
+            # Those letters are all cased, so title() capitalizes per word
+            # exactly like str.capitalize() did
+            name = ' '.join(match.group(1).split()).title()
+            # Validate it looks like a name (not too long); the length is of
+            # the recapitalized name, as before (İ lowercases to two chars)
+            if len(name) <= 30:
                 return name
     
     return "NA"
@@ -174,9 +334,12 @@ def extract_email(text):
     if text is None or text == "":
         return "NA"
 
-    # Pattern to match email addresses
-    email_pattern = r'[\w\.-]+@[\w\.-]+'
-    match = re.search(email_pattern, str(text))
+    text_str = str(text)
+    # Every email has an "@"; a plain substring check is far cheaper than the regex
+    if '@' not in text_str:
+        return "NA"
+
+    match = _EMAIL_RE.search(text_str)
 
     if match:
         return match.group(0)
@@ -200,55 +363,39 @@ def extract_phone(text):
         return "NA"
 
     text_str = str(text)
+    lower = _lower_keeping_offsets(text_str)
 
     # Phone number patterns - multiple formats supported
-    phone_patterns = [
-        # Format with parentheses: (003) 941-7614
-        (r'\((\d{3})\)\s*(\d{3})[-.\s]?(\d{4})', 3),
-        # Format with dashes: 116-048-7515
-        (r'\b(\d{3})-(\d{3})-(\d{4})\b', 3),
-        # Format with dots: 555.123.4567
-        (r'\b(\d{3})\.(\d{3})\.(\d{4})\b', 3),
-        # Format with spaces: 555 123 4567
-        (r'\b(\d{3})\s(\d{3})\s(\d{4})\b', 3),
-    ]
-
-    for pattern, num_groups in phone_patterns:
-        matches = list(re.finditer(pattern, text_str))
+    for pattern in _PHONE_RES:
+        matches = list(pattern.finditer(text_str))
         for match in matches:
-            # Check context - make sure it's not preceded by "order" keywords
+            # Check context - make sure it's not preceded by "order" keywords.
+            # The 50 chars before and 30 after are checked in place in `lower`.
             start_pos = match.start()
-            context_before = text_str[max(0, start_pos-50):start_pos].lower()
-            context_after = text_str[match.end():min(len(text_str), match.end()+30)].lower()
+            before_start = max(0, start_pos-50)
 
             # Skip if it's in order ID context
-            if re.search(r'order\s*(id|number|#|:)', context_before):
+            if _ORDER_CTX_RE.search(lower, before_start, start_pos):
                 continue
-            if re.search(r'order', context_before) and not re.search(r'phone|call|contact|number', context_before):
+            if lower.find('order', before_start, start_pos) != -1 and \
+                    not _PHONE_OR_NUMBER_CTX_RE.search(lower, before_start, start_pos):
                 # If "order" is mentioned but not "phone", skip
                 continue
 
             # Check if context mentions phone explicitly
-            is_phone_context = re.search(r'phone|call|contact|reach|mobile|cell', context_before) or \
-                               re.search(r'phone|call|contact|reach|mobile|cell', context_after)
-
-            # Reconstruct phone number
-            if num_groups == 3:
-                phone_clean = match.group(1) + match.group(2) + match.group(3)
-            else:
-                phone_clean = ''.join(match.groups())
-
-            # Verify it's 10 digits
-            if phone_clean.isdigit() and len(phone_clean) == 10:
-                # For non-parenthesis formats, require phone context to avoid order ID confusion
-                has_parens = '(' in match.group(0)
-                if has_parens or is_phone_context:
-                    return f"{phone_clean[:3]}-{phone_clean[3:6]}-{phone_clean[6:]}"
+            is_phone_context = _PHONE_CTX_RE.search(lower, before_start, start_pos) or \
+                               _PHONE_CTX_RE.search(lower, match.end(), match.end()+30)
+
+            # For non-parenthesis formats, require phone context to avoid order ID confusion.
+            # The 3-3-4 groups are always 10 ASCII digits, so no further validation is needed.
+            has_parens = '(' in match.group(0)
+            if has_parens or is_phone_context:
+                return '-'.join(match.groups())
 
     return "NA"
 
 
-def extract_zip_code(text):
+def extract_zip_code(text, mentions_zip=True):
     """
     Extract zip code from conversation text.
     Supports both 5-digit and 5+4 format (e.g., 12345 or 12345-6789).
@@ -256,6 +403,7 @@ def extract_zip_code(text):
 
     Args:
         text: String containing conversation text
+        mentions_zip: False if the text is known not to contain "zip"
 
     Returns:
         Zip code if found, "NA" otherwise
@@ -265,80 +413,67 @@ def extract_zip_code(text):
 
     text_str = str(text)
 
+    # Every pattern below needs a run of 5 digits
+    if not _FIVE_DIGITS_RE.search(text_str):
+        return "NA"
+
     # First, look for explicit mentions of zip code
     # Pattern 1: "zip code" or "zip" followed by a 5-digit number
-    explicit_zip_patterns = [
-        r'(?:zip\s*(?:code|is|:)?\s*)(\d{5}(?:-\d{4})?)',  # "zip code 12345" or "zip: 12345" or "zip is 12345"
-        r'(?:zip\s+)(\d{5}(?:-\d{4})?)',  # "zip 12345"
-    ]
-
-    for pattern in explicit_zip_patterns:
-        match = re.search(pattern, text_str, re.IGNORECASE)
+    for pattern in (_EXPLICIT_ZIP_RES if mentions_zip else ()):
+        match = pattern.search(text_str)
         if match:
             zip_code = match.group(1)
             return zip_code
 
     # Pattern 2: 5+4 format (12345-6789) - always return if found
-    zip_plus4_pattern = r'\b(\d{5}-\d{4})\b'
-    match = re.search(zip_plus4_pattern, text_str)
+    match = _ZIP_PLUS4_RE.search(text_str)
     if match:
         return match.group(1)
 
     # Pattern 3: Look for 5-digit numbers in address contexts
     # Address pattern: Street, City, State ZIP
-    address_zip_pattern = r'(?:street|ave|avenue|road|rd|drive|dr|blvd|boulevard|way|ln|lane|st|circle)\s+[^,]*,\s*[^,]*,\s*[A-Z]{2}\s+(\d{5})'
-    match = re.search(address_zip_pattern, text_str, re.IGNORECASE)
+    match = _ADDRESS_ZIP_RE.search(text_str)
     if match:
         return match.group(1)
 
     # Pattern 4: Look for standalone 5-digit numbers that are likely zip codes
     # Check all 5-digit numbers and determine if they're zip codes
-    all_5digit = list(re.finditer(r'\b(\d{5})\b', text_str))
+    all_5digit = list(_ZIP5_RE.finditer(text_str))
+    lower = _lower_keeping_offsets(text_str) if all_5digit else ""
 
     for match in all_5digit:
         zip_candidate = match.group(1)
         start_pos = match.start()
         end_pos = match.end()
 
-        # Get context around the number
-        context_before = text_str[max(0, start_pos-50):start_pos].lower()
-        context_after = text_str[end_pos:min(len(text_str), end_pos+50)].lower()
-        surrounding = text_str[max(0, start_pos-10):end_pos+10]
+        # Get context around the number (searched in place via pos/endpos
+        # rather than sliced out)
+        surrounding_start = max(0, start_pos-10)
+        surrounding_end = end_pos+10
 
         # Skip if it's part of a phone number (has parentheses nearby)
-        if re.search(r'\(\d{3}\)', surrounding):
+        if _PAREN_AREA_CODE_RE.search(text_str, surrounding_start, surrounding_end):
             continue
 
         # Skip if it's in order ID context
-        if re.search(r'order\s+(id|number|#)', context_before):
+        if _ORDER_LABEL_RE.search(lower, max(0, start_pos-50), start_pos):
             continue
 
         # Skip if it's part of a longer number (like part of order ID)
         # Check if there are 6+ digit numbers nearby
-        nearby_long_numbers = re.findall(r'\d{6,}', surrounding)
-        if nearby_long_numbers:
+        if _LONG_NUMBER_RE.search(text_str, surrounding_start, surrounding_end):
             # If this 5-digit number is part of a longer sequence, skip it
             continue
 
-        # If it's mentioned near "zip", "address", "location", or city/state, it's likely a zip code
-        if any(keyword in context_before or context_after for keyword in ['zip', 'address', 'location', 'city', 'state']):
-            return zip_candidate
-
-        # If it appears after a state abbreviation pattern (2 letters + space/number)
-        if re.search(r'[A-Z]{2}\s+' + re.escape(zip_candidate), text_str, re.IGNORECASE):
-            return zip_candidate
-
-        # If it's a standalone 5-digit number and not in problematic context, consider it
-        # But be more conservative - only if it's clearly not part of something else
-        if not re.search(r'\d{6,}', surrounding):  # No 6+ digit numbers nearby
-            # If there's no clear indication it's NOT a zip code, return it
-            # (This catches cases like "78202" mentioned alone)
-            return zip_candidate
+        # Past the checks above every candidate was accepted, whether it sat near
+        # "zip"/"address" keywords, after a state abbreviation, or stood alone
+        # (this catches cases like "78202" mentioned alone)
+        return zip_candidate
 
     return "NA"
 
 
-def extract_order_id(text):
+def extract_order_id(text, mentions_order=True, has_nine_digit_run=True):
     """
     Extract order ID from conversation text.
     Order ID is only numbers (no letters).
@@ -346,6 +481,8 @@ def extract_order_id(text):
 
     Args:
         text: String containing conversation text
+        mentions_order: False if the text is known not to contain "order"
+        has_nine_digit_run: False if the text is known to have no run of 9+ digits
 
     Returns:
         Order ID if found, "NA" otherwise
@@ -359,52 +496,39 @@ def extract_order_id(text):
     # Priority order: most specific first
 
     # Pattern 1: "order ID. It is 1012809669" or "order id: 12345" or "order id is 12345"
-    patterns = [
-        r'(?:order\s+id\.?\s*(?:it\s+is|is|:)\s*)(\d{6,})',  # "order ID. It is 1012809669" or "order id: 12345" (6+ digits)
-        r'(?:order\s+id\.?\s*:?\s*)(\d{6,})',  # "order id: 12345" or "order id 12345" (6+ digits)
-        r'(?:order\s+number\.?\s*(?:it\s+is|is|:)?\s*)(\d{6,})',  # "order number: 12345" or "order number 12345"
-        r'(?:order\s+#\s*)(\d{6,})',  # "order # 12345"
-        r'(?:order\s+)(\d{6,})',  # "order 123456" format (6+ digits)
-    ]
-
-    for pattern in patterns:
-        matches = list(re.finditer(pattern, text_str, re.IGNORECASE))
+    # (patterns 1 and 2 all need the word "order")
+    for pattern in (_ORDER_ID_PATTERNS if mentions_order else ()):
+        matches = list(pattern.finditer(text_str))
         for match in matches:
-            order_id = match.group(1)
-            # Verify it's only numbers (no letters) and is long enough
-            if order_id.isdigit() and len(order_id) >= 6:
-                # Skip if it's clearly part of an account ID (has letters nearby)
-                start_pos = match.start()
-                end_pos = match.end()
-                surrounding = text_str[max(0, start_pos-5):end_pos+5]
-                # Check if there are letters immediately before or after (account ID pattern)
-                if re.search(r'[A-Za-z]\d{6,}|\d{6,}[A-Za-z]', surrounding):
-                    continue
-                return order_id
+            # The group is (\d{6,}), so it is always numeric and long enough.
+            # Skip if it's clearly part of an account ID (has letters nearby)
+            start_pos = match.start()
+            end_pos = match.end()
+            # Check if there are letters immediately before or after (account ID pattern)
+            if _ACCOUNT_ID_RE.search(text_str, max(0, start_pos-5), end_pos+5):
+                continue
+            return match.group(1)
 
     # Pattern 2: Look for numbers that appear right after "order id" on the same or next line
     # This handles cases like:
     # "Do you have an order ID?"
     # "2243746561"
-    order_id_context = re.finditer(r'order\s+(?:id|number|#)', text_str, re.IGNORECASE)
+    order_id_context = _ORDER_LABEL_ANYCASE_RE.finditer(text_str) if mentions_order else ()
     for match in order_id_context:
-        # Look for a number within 100 characters after "order id"
+        # Look for a number within 100 characters after "order id" (sliced rather
+        # than searched with pos, so \b treats the start of the window as a boundary)
         after_text = text_str[match.end():match.end()+100]
         # Find the first standalone number (6+ digits) that appears
-        number_match = re.search(r'\b(\d{6,})\b', after_text)
+        number_match = _STANDALONE_LONG_NUMBER_RE.search(after_text)
         if number_match:
-            order_id = number_match.group(1)
-            # Verify it's only numbers and not part of account ID
-            if order_id.isdigit():
-                # Check if it's part of an account ID (has letters nearby)
-                check_text = text_str[match.end():match.end()+number_match.end()+10]
-                if not re.search(r'[A-Za-z]\d{6,}|\d{6,}[A-Za-z]', check_text):
-                    return order_id
+            # Check if it's part of an account ID (has letters nearby)
+            if not _ACCOUNT_ID_RE.search(text_str, match.end(), match.end()+number_match.end()+10):
+                return number_match.group(1)
 
     # Pattern 3: Look for standalone long numeric sequences (9+ digits) that aren't phone numbers
     # Phone numbers have specific formats with parentheses/dashes, so plain long numbers are likely order IDs
-    long_number_pattern = r'\b(\d{9,})\b'
-    matches = list(re.finditer(long_number_pattern, text_str))
+    matches = list(_NINE_PLUS_DIGITS_RE.finditer(text_str)) if has_nine_digit_run else []
+    lower = _lower_keeping_offsets(text_str) if matches else ""
 
     for match in matches:
         number = match.group(1)
@@ -412,57 +536,167 @@ def extract_order_id(text):
         end_pos = match.end()
 
         # Check context around the number
-        context_before = text_str[max(0, start_pos-50):start_pos].lower()
-        context_after = text_str[end_pos:min(len(text_str), end_pos+50)].lower()
-        surrounding_text = text_str[max(0, start_pos-10):end_pos+10]
+        context_before = lower[max(0, start_pos-50):start_pos]
+        context_after = lower[end_pos:end_pos+50]
+        surrounding_start = max(0, start_pos-10)
+        surrounding_end = end_pos+10
 
         # Skip if it's in a phone number format (has parentheses around area code)
-        if re.search(r'\(\d{3}\)', surrounding_text):
+        if _PAREN_AREA_CODE_RE.search(text_str, surrounding_start, surrounding_end):
             continue
 
         # Skip if it's in a phone number format with dashes/spaces (XXX-XXX-XXXX)
-        if re.search(r'\d{3}[-.\s]\d{3}[-.\s]\d{4}', surrounding_text):
+        if _PHONE_SHAPE_RE.search(text_str, surrounding_start, surrounding_end):
             continue
 
         # Skip if it looks like a phone number context
         if any(keyword in context_before or context_after for keyword in ['phone', 'call', 'contact', 'telephone']):
             # But allow if it's explicitly in order context
             if 'order' in context_before:
-                if number.isdigit():
-                    return number
+                return number
             continue
 
         # If it's explicitly in order context, return it
         if 'order' in context_before or 'order' in context_after:
-            if number.isdigit():
-                return number
+            return number
 
-        # If it's a plain number (no separators) and 9+ digits, it's likely an order ID
-        # (phone numbers are typically 10 digits with formatting, order IDs can be longer)
-        if number.isdigit() and len(number) >= 9:
-            # Double check: if it's exactly 10 digits and not in order context, be cautious
-            if len(number) == 10:
-                # Only return if there's some indication it's an order ID
-                if 'order' in context_before or 'order' in context_after:
-                    return number
-                # Skip 10-digit numbers that might be phones
-                continue
-            else:
-                # 9 digits or 11+ digits are more likely to be order IDs
-                return number
+        # Otherwise it's a plain number (no separators) of 9+ digits, likely an order ID
+        # (phone numbers are typically 10 digits with formatting, order IDs can be longer).
+        # Skip 10-digit numbers that might be phones (any order context returned above);
+        # 9 digits or 11+ digits are more likely to be order IDs
+        if len(number) != 10:
+            return number
 
     return "NA"
 
 def regex_extract_fields(text: str) -> Dict[str, str]:
     """Legacy format for compatibility"""
+    # One combined pass over the text to find what the field extractors need to
+    # match anything at all: an "@" for emails, and a digit run of 4+ (phone),
+    # 5+ (zip code) or 6+ (order ID). Extractors without an anchor are skipped,
+    # and the "order"/"zip" keywords and 9+ digit runs gate individual patterns.
+    # The extractors themselves stay separate passes: each applies its own
+    # priority order over several patterns, which one alternation would lose.
+    text = str(text)
+    has_at = has_order = has_zip = False
+    longest_digit_run = 0
+    for match in _ANCHOR_RE.finditer(text):
+        group = match.lastgroup
+        if group == "digits":
+            longest_digit_run = max(longest_digit_run, match.end() - match.start())
+        elif group == "at":
+            has_at = True
+        elif group == "order":
+            has_order = True
+        else:
+            has_zip = True
+        if has_at and has_order and has_zip and longest_digit_run >= 9:
+            break
+
     return {
-        "email": extract_email(text),
-        "phone": extract_phone(text),
-        "zipCode": extract_zip_code(text),
-        "orderId": extract_order_id(text),
+        "email": extract_email(text) if has_at else "NA",
+        "phone": extract_phone(text) if longest_digit_run >= 4 else "NA",
+        "zipCode": extract_zip_code(text, mentions_zip=has_zip) if longest_digit_run >= 5 else "NA",
+        "orderId": extract_order_id(
+            text, mentions_order=has_order, has_nine_digit_run=longest_digit_run >= 9
+        ) if longest_digit_run >= 6 else "NA",
         "customerName": extract_customer_name(text),
     }
 
+# Worker processes for regex extraction over bulk uploads (created on first use)
+REGEX_POOL_MIN_BATCH = 32  # smaller batches are cheaper to extract inline
+_regex_pool: Optional[ProcessPoolExecutor] = None
+
+def get_regex_pool() -> ProcessPoolExecutor:
+    global _regex_pool
+    if _regex_pool is None:
+        _regex_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _regex_pool
+
+def _regex_extract_chunk(texts: List[str]) -> List[Dict[str, str]]:
+    return [regex_extract_fields(text) for text in texts]
+
+# LRU cache of regex results keyed by a hash of the conversation text, so
+# re-uploaded files skip extraction (LLM results are cached by the extractor)
+REGEX_CACHE_SIZE = 4096
+_regex_cache: "OrderedDict[bytes, Dict[str, str]]" = OrderedDict()
+
+async def _regex_extract_uncached(texts: List[str]) -> List[Dict[str, str]]:
+    global _regex_pool
+    if len(texts) < REGEX_POOL_MIN_BATCH:
+        return _regex_extract_chunk(texts)
+
+    # One chunk per worker keeps pickling overhead to a few round-trips
+    workers = os.cpu_count() or 1
+    chunk_size = -(-len(texts) // workers)
+    loop = asyncio.get_running_loop()
+    pool = get_regex_pool()
+    try:
+        chunks = await asyncio.gather(*(
+            loop.run_in_executor(pool, _regex_extract_chunk, texts[i:i + chunk_size])
+            for i in range(0, len(texts), chunk_size)
+        ))
+    except BrokenProcessPool:
+        # A worker died (e.g. OOM-killed). Drop the pool so the next batch
+        # starts a fresh one, and finish this batch inline.
+        if _regex_pool is pool:
+            _regex_pool = None
+            pool.shutdown(wait=False, cancel_futures=True)
+        print("Regex worker pool broke; extracting this batch inline")
+        return _regex_extract_chunk(texts)
+    return [result for chunk in chunks for result in chunk]
+
+def _regex_cache_key(text: str) -> bytes:
+    # A fixed-size digest keeps long conversations out of the cache keys
+    return blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+def regex_extract_cached(text: str) -> Dict[str, str]:
+    """Regex-extract a single conversation, reusing the batch result cache"""
+    key = _regex_cache_key(text)
+    cached = _regex_cache.get(key)
+    if cached is not None:
+        _regex_cache.move_to_end(key)
+    else:
+        cached = _regex_cache[key] = regex_extract_fields(text)
+        if len(_regex_cache) > REGEX_CACHE_SIZE:
+            _regex_cache.popitem(last=False)
+    return dict(cached)
+
+async def regex_extract_many(texts: List[str]) -> List[Dict[str, str]]:
+    """Regex-extract a batch of conversations, split across worker processes"""
+    keys = [_regex_cache_key(text) for text in texts]
+    results: List[Optional[Dict[str, str]]] = [None] * len(texts)
+    misses = []
+    for i, key in enumerate(keys):
+        cached = _regex_cache.get(key)
+        if cached is not None:
+            _regex_cache.move_to_end(key)
+            results[i] = dict(cached)
+        else:
+            misses.append(i)
+    
+    if misses:
+        computed = await _regex_extract_uncached([texts[i] for i in misses])
+        for i, result in zip(misses, computed):
+            _regex_cache[keys[i]] = result
+            results[i] = dict(result)
+        while len(_regex_cache) > REGEX_CACHE_SIZE:
+            _regex_cache.popitem(last=False)
+    return results
+
+# Fields produced by both extractors
+EXTRACTED_FIELDS = ("email", "phone", "zipCode", "orderId")
+
+def merge_extraction_results(regex_result: Dict[str, str], llm_result: Dict[str, str]) -> Dict[str, str]:
+    """Take each field from regex if it found one, else from the LLM, else "NA"
+    
+    llm_result is empty whenever the LLM is unavailable or was not called.
+    """
+    return {
+        field: value if (value := regex_result.get(field, "NA")) != "NA" else llm_result.get(field, "NA")
+        for field in EXTRACTED_FIELDS
+    }
+
 # LLM Extraction Class
 class AsyncLLMExtractor:
     """Gemini-based LLM extractor for field extraction"""
@@ -480,18 +714,33 @@ class AsyncLLMExtractor:
         # Configure Gemini
         genai.configure(api_key=gemini_key)
         
-        # Use Gemini 2.0 Flash for fast extraction
-        self.model = genai.GenerativeModel('gemini-2.5-flash')
+        # Use Gemini 2.0 Flash for fast extraction, in JSON mode so the reply is
+        # a bare JSON object that can be parsed directly
+        self.model = genai.GenerativeModel(
+            'gemini-2.5-flash',
+            generation_config={"response_mime_type": "application/json", "temperature": 0}
+        )
+        
+        # LRU cache of results keyed by a hash of the prompt inputs, plus the
+        # calls currently in flight so identical concurrent requests share one.
+        # Both are only touched from the event loop, so no lock is needed.
+        self.cache_size = 1024
+        self._cache: "OrderedDict[bytes, Dict[str, str]]" = OrderedDict()
+        self._inflight: Dict[bytes, asyncio.Future] = {}
+        
+        self.field_descriptions = {
+            "email": 'Email address (return single best match or "NA")',
+            "phone": 'Phone number (return single best match or "NA")',
+            "zipCode": 'ZIP code (return single best match or "NA")',
+            "orderId": 'Order ID or reference number (return single best match or "NA")',
+        }
         
         self.prompt_template = """You are an intelligent assistant that extracts structured data from customer service conversations.
 
 Extract the following information from the conversation below:
-- email: Email address (return single best match or "NA")
-- phone: Phone number (return single best match or "NA") 
-- zipCode: ZIP code (return single best match or "NA")
-- orderId: Order ID or reference number (return single best match or "NA")
+{field_list}
 
-Return ONLY a valid JSON object with these exact keys: email, phone, zipCode, orderId
+Return ONLY a valid JSON object with these exact keys: {field_keys}
 Return "NA" for any field where no valid information is found.
 
 Conversation:
@@ -499,94 +748,197 @@ Conversation:
 
 Respond with ONLY the JSON object, no other text:"""
 
-    async def extract_async(self, text: str) -> Dict[str, str]:
-        try:
-            prompt = self.prompt_template.format(conversation=text[:4000])  # Limit text length
-            
-            # Use async generation
-            response = await asyncio.to_thread(
-                self.model.generate_content,
-                prompt
-            )
-            
-            # Parse the response
-            content = response.text.strip()
-            
-            # Clean up the response (remove markdown code blocks if present)
-            if content.startswith("```json"):
-                content = content[7:]
-            if content.startswith("```"):
-                content = content[3:]
-            if content.endswith("```"):
-                content = content[:-3]
-            content = content.strip()
-            
-            # Parse JSON
-            result = json.loads(content)
-            
-            # Ensure all required fields exist
-            return {
-                "email": result.get("email", "NA"),
-                "phone": result.get("phone", "NA"), 
-                "zipCode": result.get("zipCode", "NA"),
-                "orderId": result.get("orderId", "NA"),
-            }
+    async def extract_async(self, text: str, fields=EXTRACTED_FIELDS) -> Dict[str, str]:
+        """Extract `fields` (all extracted fields by default) with the LLM"""
+        key = blake2b("\x1f".join((*fields, text[:4000])).encode(), digest_size=16).digest()
+        
+        while True:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return dict(cached)
             
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                break
+            try:
+                # shield: a cancelled waiter must not cancel the shared call
+                return dict(await asyncio.shield(inflight))
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise
+                # The owning call failed or was cancelled; make our own
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await self._generate(text, fields)
+            self._cache[key] = result
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+            future.set_result(result)
         except Exception as e:
+            # Failures are not cached so the next request retries
             print(f"LLM extraction error: {e}")
-            return {"email": "NA", "phone": "NA", "zipCode": "NA", "orderId": "NA"}
+            result = {"email": "NA", "phone": "NA", "zipCode": "NA", "orderId": "NA"}
+        finally:
+            del self._inflight[key]
+            if not future.done():
+                # Waiters retry themselves rather than receive a made-up all-NA answer
+                future.cancel()
+        return dict(result)
+
+    async def _generate(self, text: str, fields) -> Dict[str, str]:
+        prompt = self.prompt_template.format(
+            field_list="\n".join(f"- {field}: {self.field_descriptions[field]}" for field in fields),
+            field_keys=", ".join(fields),
+            conversation=text[:4000]  # Limit text length
+        )
+        
+        # Native async generation (async HTTP client, no worker thread per call)
+        response = await self.model.generate_content_async(prompt)
+        
+        # Parse JSON (JSON mode returns no markdown code fences to strip)
+        result = orjson.loads(response.text)
+        
+        # Ensure all required fields exist
+        return {
+            "email": result.get("email", "NA"),
+            "phone": result.get("phone", "NA"), 
+            "zipCode": result.get("zipCode", "NA"),
+            "orderId": result.get("orderId", "NA"),
+        }
 
-# Initialize LLM extractor
-try:
-    llm_extractor = AsyncLLMExtractor()
-    LLM_AVAILABLE = True
-except Exception as e:
-    print(f"LLM not available: {e}")
-    llm_extractor = None
-    LLM_AVAILABLE = False
+# LLM extractor (set up in the startup hook)
+llm_extractor: Optional[AsyncLLMExtractor] = None
+LLM_AVAILABLE = False
+
+# Cap on concurrent LLM calls when extracting many conversations at once
+LLM_CONCURRENCY = 16
+_llm_semaphore = asyncio.Semaphore(LLM_CONCURRENCY)
 
 # Database helper functions
-def get_db_connection():
-    return sqlite3.connect(DATABASE_PATH)
+# Connections are long-lived so their page caches stay warm: one shared write
+# connection (SQLite allows a single writer anyway) behind a lock, plus a small
+# pool of read-only connections for the GET endpoints.
+DB_READ_POOL_SIZE = os.cpu_count() or 4
+_read_pool: "queue.Queue[sqlite3.Connection]" = queue.Queue(maxsize=DB_READ_POOL_SIZE)
+_write_lock = threading.Lock()
+
+def open_db_connection(read_only: bool = False) -> sqlite3.Connection:
+    if read_only:
+        conn = sqlite3.connect(f"file:{DATABASE_PATH}?mode=ro", uri=True, check_same_thread=False)
+    else:
+        conn = sqlite3.connect(DATABASE_PATH, check_same_thread=False)
+    apply_connection_pragmas(conn)
+    return conn
+
+# Opened in the startup hook, before any read-only connection
+_write_conn: Optional[sqlite3.Connection] = None
+
+@contextmanager
+def db_read():
+    """Borrow a read-only connection from the pool"""
+    try:
+        conn = _read_pool.get_nowait()
+    except queue.Empty:
+        conn = open_db_connection(read_only=True)
+    try:
+        yield conn
+    finally:
+        try:
+            _read_pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+@contextmanager
+def db_write():
+    """Use the shared write connection; commits on success, rolls back on error"""
+    with _write_lock:
+        try:
+            yield _write_conn
+            _write_conn.commit()
+        except BaseException:
+            _write_conn.rollback()
+            raise
+
+# Shared by the single and bulk save paths
+INSERT_CONVERSATION_SQL = """
+    INSERT INTO conversations (id, title, content, fileName, createdAt)
+    VALUES (?, ?, ?, ?, ?)
+"""
+INSERT_EXTRACTED_FIELDS_SQL = """
+    INSERT INTO extracted_fields 
+    (conversationId, email, phone, zipCode, orderId, metadata, extractionMethod)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
 
-def save_conversation(conversation_data: dict, extracted_fields: dict) -> str:
+def save_conversation(conversation_data: dict, extracted_fields: dict, created_at: Optional[str] = None) -> str:
     """Save conversation and extracted fields to database"""
-    conversation_id = f"conv_{int(time.time())}_{str(uuid4())[:8]}"
+    conversation_id = f"conv_{uuid4().hex}"
     
-    conn = get_db_connection()
-    cursor = conn.cursor()
+    with db_write() as conn:
+        cursor = conn.cursor()
+        # Both inserts go in one transaction (one commit / WAL sync per conversation)
+        cursor.execute("BEGIN IMMEDIATE")
+        
+        # Save conversation
+        cursor.execute(INSERT_CONVERSATION_SQL, (
+            conversation_id,
+            conversation_data["title"],
+            conversation_data["content"],
+            conversation_data.get("fileName"),
+            created_at or datetime.now().isoformat()
+        ))
+        
+        # Save extracted fields
+        cursor.execute(INSERT_EXTRACTED_FIELDS_SQL, (
+            conversation_id,
+            extracted_fields["email"],
+            extracted_fields["phone"], 
+            extracted_fields["zipCode"],
+            extracted_fields["orderId"],
+            orjson.dumps(extracted_fields.get("metadata", {})).decode(),
+            "hybrid" if LLM_AVAILABLE else "regex"
+        ))
     
-    # Save conversation
-    cursor.execute("""
-        INSERT INTO conversations (id, title, content, fileName, createdAt)
-        VALUES (?, ?, ?, ?, ?)
-    """, (
-        conversation_id,
-        conversation_data["title"],
-        conversation_data["content"],
-        conversation_data.get("fileName"),
-        datetime.now().isoformat()
-    ))
+    return conversation_id
+
+def save_conversations_bulk(items: List[tuple], created_at: Optional[str] = None) -> List[str]:
+    """Save (conversation_data, extracted_fields) pairs in a single transaction"""
+    extraction_method = "hybrid" if LLM_AVAILABLE else "regex"
+    created_at = created_at or datetime.now().isoformat()
     
-    # Save extracted fields
-    cursor.execute("""
-        INSERT INTO extracted_fields 
-        (conversationId, email, phone, zipCode, orderId, metadata, extractionMethod)
-        VALUES (?, ?, ?, ?, ?, ?, ?)
-    """, (
-        conversation_id,
-        extracted_fields["email"],
-        extracted_fields["phone"], 
-        extracted_fields["zipCode"],
-        extracted_fields["orderId"],
-        json.dumps(extracted_fields.get("metadata", {})),
-        "hybrid" if LLM_AVAILABLE else "regex"
-    ))
+    conversation_ids = []
+    conversation_rows = []
+    field_rows = []
+    for conversation_data, extracted_fields in items:
+        conversation_id = f"conv_{uuid4().hex}"
+        conversation_ids.append(conversation_id)
+        conversation_rows.append((
+            conversation_id,
+            conversation_data["title"],
+            conversation_data["content"],
+            conversation_data.get("fileName"),
+            created_at
+        ))
+        field_rows.append((
+            conversation_id,
+            extracted_fields["email"],
+            extracted_fields["phone"],
+            extracted_fields["zipCode"],
+            extracted_fields["orderId"],
+            orjson.dumps(extracted_fields.get("metadata", {})).decode(),
+            extraction_method
+        ))
     
-    conn.commit()
-    conn.close()
+    with db_write() as conn:
+        cursor = conn.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        cursor.executemany(INSERT_CONVERSATION_SQL, conversation_rows)
+        cursor.executemany(INSERT_EXTRACTED_FIELDS_SQL, field_rows)
     
-    return conversation_id
+    return conversation_ids
 
 # API Routes
 @app.get("/")
@@ -598,18 +950,25 @@ async def root():
         "database": "sqlite"
     }
 
-@app.post("/extract", response_model=ExtractResponse)
+@app.post("/extract", response_model=None, responses={200: {"model": ExtractResponse}})
 async def extract_fields(request: ExtractRequest):
     """Extract fields using hybrid regex + LLM approach"""
+    # The dict already has the ExtractResponse shape, so hand it straight to
+    # orjson instead of validating and re-encoding it through the model
+    return ORJSONResponse(await hybrid_extract(request.text, request.fileName))
+
+async def hybrid_extract(text: str, file_name: Optional[str] = None) -> Dict:
+    """Run regex extraction, fill the fields it missed with the LLM and merge the results"""
     
     # Always perform regex extraction
-    regex_result = regex_extract_fields(request.text)
+    regex_result = regex_extract_cached(text)
     
-    # Perform LLM extraction if available
+    # Perform LLM extraction if available, only for the fields regex missed
+    missing = [field for field in EXTRACTED_FIELDS if regex_result.get(field, "NA") == "NA"]
     llm_result = {}
-    if LLM_AVAILABLE and llm_extractor:
+    if LLM_AVAILABLE and llm_extractor and missing:
         try:
-            llm_result = await llm_extractor.extract_async(request.text)
+            llm_result = await llm_extractor.extract_async(text, missing)
         except Exception as e:
             print(f"LLM extraction failed: {e}")
             llm_result = {"email": "NA", "phone": "NA", "zipCode": "NA", "orderId": "NA"}
@@ -618,108 +977,105 @@ async def extract_fields(request: ExtractRequest):
     # Priority: 1) If both found something, prefer regex (more deterministic)
     #           2) If only one found something, use that
     #           3) If neither found anything, return "NA"
-    final_result = {}
-    for field in ["email", "phone", "zipCode", "orderId"]:
-        regex_val = regex_result.get(field, "NA")
-        llm_val = llm_result.get(field, "NA") if LLM_AVAILABLE else "NA"
-        
-        # Smart combination: use whichever found something
-        if regex_val != "NA":
-            final_result[field] = regex_val  # Prefer regex (deterministic)
-        elif llm_val != "NA":
-            final_result[field] = llm_val  # Fallback to LLM
-        else:
-            final_result[field] = "NA"
+    final_result = merge_extraction_results(regex_result, llm_result)
     
     # Add metadata
     metadata = {
-        "fileName": request.fileName,
+        "fileName": file_name,
         "processedAt": datetime.now().isoformat(),
-        "textLength": len(request.text),
+        "textLength": len(text),
         "extractionMethod": "hybrid" if LLM_AVAILABLE else "regex",
         "regexResults": regex_result,
         "llmResults": llm_result if LLM_AVAILABLE else None
     }
     
-    return ExtractResponse(
-        email=final_result["email"],
-        phone=final_result["phone"],
-        zipCode=final_result["zipCode"],
-        orderId=final_result["orderId"],
-        metadata=metadata
-    )
+    return {
+        "email": final_result["email"],
+        "phone": final_result["phone"],
+        "zipCode": final_result["zipCode"],
+        "orderId": final_result["orderId"],
+        "metadata": metadata
+    }
 
 @app.get("/conversations")
-async def get_conversations():
-    """Get all conversations with their extracted fields"""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    cursor.execute("""
-        SELECT c.*, ef.email, ef.phone, ef.zipCode, ef.orderId, ef.metadata, ef.extractionMethod
-        FROM conversations c
-        LEFT JOIN extracted_fields ef ON c.id = ef.conversationId
-        ORDER BY c.createdAt DESC
-    """)
-    
-    conversations = cursor.fetchall()
-    conn.close()
+async def get_conversations(
+    limit: Optional[int] = Query(None, ge=1),
+    offset: int = Query(0, ge=0)
+):
+    """Get conversations (newest first, optionally paginated) with their extracted fields.
     
+    Only a 100-character preview of each conversation is returned; the full
+    content is available from GET /conversations/{conversation_id}.
+    """
     result = []
-    for conv in conversations:
-        result.append({
-            "id": conv[0],
-            "title": conv[1], 
-            "content": conv[2],
-            "fileName": conv[3],
-            "createdAt": conv[4],
-            "date": datetime.fromisoformat(conv[4]).strftime("%Y-%m-%d"),
-            "preview": conv[2][:100] + "..." if len(conv[2]) > 100 else conv[2],
-            "extractedFields": {
-                "email": conv[6] or "NA",
-                "phone": conv[7] or "NA", 
-                "zipCode": conv[8] or "NA",
-                "orderId": conv[9] or "NA",
-            },
-            "metadata": json.loads(conv[10]) if conv[10] else {},
-            "extractionMethod": conv[11] or "unknown"
-        })
+    with db_read() as conn:
+        cursor = conn.cursor()
+        cursor.row_factory = sqlite3.Row
+        # Bulk saves share one createdAt, so rowid keeps those rows newest-first
+        # (and LIMIT/OFFSET pages stable)
+        cursor.execute("""
+            SELECT c.id, c.title, substr(c.content, 1, 100) AS preview, length(c.content) AS contentLength,
+                   c.fileName, c.createdAt,
+                   ef.email, ef.phone, ef.zipCode, ef.orderId, ef.metadata, ef.extractionMethod
+            FROM conversations c
+            LEFT JOIN extracted_fields ef ON c.id = ef.conversationId
+            ORDER BY c.createdAt DESC, c.rowid DESC
+            LIMIT ? OFFSET ?
+        """, (-1 if limit is None else limit, offset))
+        
+        for conversations in iter(lambda: cursor.fetchmany(200), []):
+            for conv in conversations:
+                result.append({
+                    "id": conv["id"],
+                    "title": conv["title"],
+                    "fileName": conv["fileName"],
+                    "createdAt": conv["createdAt"],
+                    "date": conv["createdAt"][:10],  # createdAt is ISO text, so the date is its prefix
+                    "preview": conv["preview"] + "..." if conv["contentLength"] > 100 else conv["preview"],
+                    "extractedFields": {
+                        "email": conv["email"] or "NA",
+                        "phone": conv["phone"] or "NA", 
+                        "zipCode": conv["zipCode"] or "NA",
+                        "orderId": conv["orderId"] or "NA",
+                    },
+                    "metadata": orjson.loads(conv["metadata"]) if conv["metadata"] else {},
+                    "extractionMethod": conv["extractionMethod"] or "unknown"
+                })
     
-    return result
+    # Plain JSON types only, so skip FastAPI's jsonable_encoder pass over the list
+    return ORJSONResponse(result)
 
 @app.get("/conversations/{conversation_id}")
 async def get_conversation(conversation_id: str):
     """Get specific conversation details"""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    cursor.execute("""
-        SELECT c.*, ef.email, ef.phone, ef.zipCode, ef.orderId, ef.metadata, ef.extractionMethod
-        FROM conversations c
-        LEFT JOIN extracted_fields ef ON c.id = ef.conversationId
-        WHERE c.id = ?
-    """, (conversation_id,))
-    
-    conversation = cursor.fetchone()
-    conn.close()
+    with db_read() as conn:
+        cursor = conn.cursor()
+        cursor.row_factory = sqlite3.Row
+        cursor.execute("""
+            SELECT c.*, ef.email, ef.phone, ef.zipCode, ef.orderId, ef.metadata, ef.extractionMethod
+            FROM conversations c
+            LEFT JOIN extracted_fields ef ON c.id = ef.conversationId
+            WHERE c.id = ?
+        """, (conversation_id,))
+        conversation = cursor.fetchone()
     
     if not conversation:
         raise HTTPException(status_code=404, detail="Conversation not found")
     
     return {
-        "id": conversation[0],
-        "title": conversation[1],
-        "content": conversation[2], 
-        "fileName": conversation[3],
-        "createdAt": conversation[4],
+        "id": conversation["id"],
+        "title": conversation["title"],
+        "content": conversation["content"], 
+        "fileName": conversation["fileName"],
+        "createdAt": conversation["createdAt"],
         "extractedFields": {
-            "email": conversation[6] or "NA",
-            "phone": conversation[7] or "NA",
-            "zipCode": conversation[8] or "NA", 
-            "orderId": conversation[9] or "NA",
+            "email": conversation["email"] or "NA",
+            "phone": conversation["phone"] or "NA",
+            "zipCode": conversation["zipCode"] or "NA", 
+            "orderId": conversation["orderId"] or "NA",
         },
-        "metadata": json.loads(conversation[10]) if conversation[10] else {},
-        "extractionMethod": conversation[11] or "unknown"
+        "metadata": orjson.loads(conversation["metadata"]) if conversation["metadata"] else {},
+        "extractionMethod": conversation["extractionMethod"] or "unknown"
     }
 
 @app.post("/conversations")
@@ -737,15 +1093,7 @@ async def create_conversation(request: ConversationCreate):
         }
     else:
         # Extract fields if not provided
-        extract_request = ExtractRequest(text=request.content, fileName=request.fileName)
-        extraction_result = await extract_fields(extract_request)
-        extracted_fields_dict = {
-            "email": extraction_result.email,
-            "phone": extraction_result.phone,
-            "zipCode": extraction_result.zipCode, 
-            "orderId": extraction_result.orderId,
-            "metadata": extraction_result.metadata
-        }
+        extracted_fields_dict = await hybrid_extract(request.content, request.fileName)
     
     # Save to database
     conversation_data = {
@@ -754,14 +1102,16 @@ async def create_conversation(request: ConversationCreate):
         "fileName": request.fileName
     }
     
-    conversation_id = save_conversation(conversation_data, extracted_fields_dict)
+    # One timestamp for the stored row and the response
+    created_at = datetime.now().isoformat()
+    conversation_id = save_conversation(conversation_data, extracted_fields_dict, created_at)
     
     return {
         "id": conversation_id,
         "title": request.title,
         "content": request.content,
         "fileName": request.fileName,
-        "date": datetime.now().strftime("%Y-%m-%d"),
+        "date": created_at[:10],
         "preview": request.content[:100] + "..." if len(request.content) > 100 else request.content,
         "extractedFields": {
             "email": extracted_fields_dict["email"],
@@ -769,30 +1119,71 @@ async def create_conversation(request: ConversationCreate):
             "zipCode": extracted_fields_dict["zipCode"],
             "orderId": extracted_fields_dict["orderId"],
         },
-        "createdAt": datetime.now().isoformat()
+        "createdAt": created_at
     }
 
 @app.post("/conversations/bulk-save")
 async def save_bulk_conversations(request: BulkSaveRequest):
     """Save multiple conversations from bulk extraction with their pre-extracted fields"""
-    saved_conversations = []
+    # One timestamp per request, shared by extraction metadata, rows and response
+    created_at = datetime.now().isoformat()
+    date = created_at[:10]
     
-    for idx, conv_result in enumerate(request.conversations):
-        # Create conversation with pre-extracted fields (only string values)
-        conv_request = ConversationCreate(
-            title=f"{request.fileName} - Conversation {idx + 1}",
-            content=f"Conversation {idx + 1} from {request.fileName}",
-            fileName=request.fileName,
-            extractedFields={
-                "email": str(conv_result.get("email", "NA")),
-                "phone": str(conv_result.get("phone", "NA")),
-                "zipCode": str(conv_result.get("zipCode", "NA")),
-                "orderId": str(conv_result.get("orderId", "NA")),
-            }
+    # Conversations sent with their text but no extraction results are
+    # extracted here, all together, before anything is written
+    pending = [
+        idx for idx, conv_result in enumerate(request.conversations)
+        if conv_result.get("text") and not any(field in conv_result for field in EXTRACTED_FIELDS)
+    ]
+    extracted = {}
+    if pending:
+        extraction_results = await extract_many(
+            [str(request.conversations[idx]["text"]) for idx in pending],
+            [request.fileName] * len(pending),
+            processed_at=created_at
         )
-        
-        result = await create_conversation(conv_request)
-        saved_conversations.append(result)
+        extracted = dict(zip(pending, extraction_results))
+    
+    items = []
+    for idx, conv_result in enumerate(request.conversations):
+        conv_result = extracted.get(idx, conv_result)
+        # Pre-extracted fields (only string values); metadata is only kept for
+        # conversations extracted above
+        conversation_data = {
+            "title": f"{request.fileName} - Conversation {idx + 1}",
+            "content": f"Conversation {idx + 1} from {request.fileName}",
+            "fileName": request.fileName
+        }
+        extracted_fields_dict = {
+            "email": str(conv_result.get("email", "NA")),
+            "phone": str(conv_result.get("phone", "NA")),
+            "zipCode": str(conv_result.get("zipCode", "NA")),
+            "orderId": str(conv_result.get("orderId", "NA")),
+            "metadata": conv_result["metadata"] if idx in extracted else {}
+        }
+        items.append((conversation_data, extracted_fields_dict))
+    
+    # One transaction for the whole batch instead of a commit per conversation
+    conversation_ids = save_conversations_bulk(items, created_at)
+    
+    saved_conversations = []
+    for conversation_id, (conversation_data, extracted_fields_dict) in zip(conversation_ids, items):
+        content = conversation_data["content"]
+        saved_conversations.append({
+            "id": conversation_id,
+            "title": conversation_data["title"],
+            "content": content,
+            "fileName": conversation_data["fileName"],
+            "date": date,
+            "preview": content[:100] + "..." if len(content) > 100 else content,
+            "extractedFields": {
+                "email": extracted_fields_dict["email"],
+                "phone": extracted_fields_dict["phone"],
+                "zipCode": extracted_fields_dict["zipCode"],
+                "orderId": extracted_fields_dict["orderId"],
+            },
+            "createdAt": created_at
+        })
     
     return {
         "success": True,
@@ -803,27 +1194,116 @@ async def save_bulk_conversations(request: BulkSaveRequest):
 @app.delete("/conversations/{conversation_id}")
 async def delete_conversation(conversation_id: str):
     """Delete conversation and its extracted fields"""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    # Delete extracted fields first (foreign key constraint)
-    cursor.execute("DELETE FROM extracted_fields WHERE conversationId = ?", (conversation_id,))
+    with db_write() as conn:
+        cursor = conn.cursor()
+        
+        # Delete extracted fields first (foreign key constraint)
+        cursor.execute("DELETE FROM extracted_fields WHERE conversationId = ?", (conversation_id,))
+        
+        # Delete conversation
+        cursor.execute("DELETE FROM conversations WHERE id = ?", (conversation_id,))
+        
+        # Raising rolls the deletes back
+        if cursor.rowcount == 0:
+            raise HTTPException(status_code=404, detail="Conversation not found")
     
-    # Delete conversation
-    cursor.execute("DELETE FROM conversations WHERE id = ?", (conversation_id,))
+    return {"success": True}
+
+# ABCD uploads at least this large are streamed with ijson (when installed), one
+# conversation at a time, instead of decoding the whole document up front
+ABCD_STREAM_MIN_CHARS = 1024 * 1024
+
+@lru_cache(maxsize=256)
+def _humanize(name: str) -> str:
+    """'storewide_query' -> 'Storewide Query' (ABCD has only a few dozen flow names)"""
+    return name.replace('_', ' ').title()
+
+def _join_turns(turns: list) -> str:
+    """Join the text of ABCD 'original' turns ([speaker, text] lists)"""
+    # Parsed JSON only yields exact lists, so type() stands in for isinstance()
+    texts = [turn[1] for turn in turns if type(turn) is list and len(turn) > 1]
+    try:
+        # Turn text is a string in well-formed data, so skip str() per turn
+        return " ".join(texts)
+    except TypeError:
+        return " ".join([str(text) for text in texts])
+
+def prepare_abcd_conversations(conversations_list) -> List[tuple]:
+    """Build (index, item, conversation text) for each ABCD conversation with text.
     
-    if cursor.rowcount == 0:
-        conn.close()
-        raise HTTPException(status_code=404, detail="Conversation not found")
+    Only the keys used after extraction (convo_id, scenario) are kept from each
+    item, so the 'original'/'delexed' turn lists can be freed as we go.
+    """
+    prepared = []
+    for idx, item in enumerate(conversations_list):
+        if isinstance(item, dict):
+            # Extract text from the conversation structure
+            conversation_text = ""
+            
+            # PRIORITY 1: Use 'original' field (has REAL data - emails, phones, etc.)
+            # NOTE: 'delexed' field has ANONYMIZED placeholders like <email>, <order_id>
+            if 'original' in item and isinstance(item['original'], list):
+                conversation_text = _join_turns(item['original'])
+            
+            # Fallback: try 'delexed' field (anonymized but better than nothing)
+            elif 'delexed' in item and isinstance(item['delexed'], list):
+                conversation_text = " ".join([
+                    turn['text'] for turn in item['delexed']
+                    if type(turn) is dict and 'text' in turn
+                ])
+            
+            # Fallback: try 'scenario' field (has structured data)
+            elif 'scenario' in item:
+                conversation_text = str(item['scenario'])
+            
+            if conversation_text.strip():
+                kept = {key: item[key] for key in ('convo_id', 'scenario') if key in item}
+                prepared.append((idx, kept, conversation_text))
+    return prepared
+
+def stream_abcd_conversations(text: str) -> List[tuple]:
+    """Prepare the 'train' conversations of an ABCD document without decoding it whole.
     
-    conn.commit()
-    conn.close()
+    Returns an empty list if the document is not valid JSON or has no
+    conversations under 'train', so the caller can fall back to a full parse.
+    """
+    try:
+        items = ijson.items(io.BytesIO(text.encode()), 'train.item', use_float=True)
+        return prepare_abcd_conversations(items)
+    except (ijson.JSONError, UnicodeEncodeError):
+        return []
+
+# 19+ digits may be an integer outside orjson's 64-bit range, which it would
+# turn into a float
+_WIDE_INT_RE = re.compile(r'[0-9]{19,}')
+
+def _loads_json(text: str):
+    """Parse JSON with orjson, falling back to the json module where they differ.
     
-    return {"success": True}
+    orjson refuses NaN/Infinity and lone surrogates and cannot keep integers
+    wider than 64 bits, all of which json handles. Raises json.JSONDecodeError
+    (of which orjson.JSONDecodeError is a subclass) only if json rejects it too.
+    """
+    if _WIDE_INT_RE.search(text) is None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
+def _parses_as_json(line: str) -> bool:
+    try:
+        _loads_json(line)
+        return True
+    except json.JSONDecodeError:
+        return False
 
 @app.post("/extract-bulk")
 async def extract_bulk(request: ExtractRequest):
     """Extract fields from multiple conversations in a file"""
+    # Results are plain dicts of JSON types, so every branch returns an
+    # ORJSONResponse directly instead of letting FastAPI run jsonable_encoder
+    # over each conversation first
     try:
         # Try to parse as JSON first (for JSONL or JSON array format)
         text = request.text.strip()
@@ -831,93 +1311,69 @@ async def extract_bulk(request: ExtractRequest):
         
         # Try parsing as complete JSON (ABCD format or JSON object with 'train' key)
         try:
-            json_data = json.loads(text)
+            prepared = []
+            if IJSON_AVAILABLE and len(text) >= ABCD_STREAM_MIN_CHARS and text.startswith('{'):
+                prepared = stream_abcd_conversations(text)
+            # Only objects and arrays are handled below, so other text (including
+            # bare JSON scalars) skips the parse and goes on to the JSONL check
+            json_data = _loads_json(text) if not prepared and text.startswith(('{', '[')) else None
             
             # Handle ABCD dataset format (has 'train' key with list of conversations)
-            if isinstance(json_data, dict) and 'train' in json_data:
-                conversations_list = json_data['train']
-                for idx, item in enumerate(conversations_list):
-                    if isinstance(item, dict):
-                        # Extract text from the conversation structure
-                        conversation_text = ""
-                        
-                        # PRIORITY 1: Use 'original' field (has REAL data - emails, phones, etc.)
-                        # NOTE: 'delexed' field has ANONYMIZED placeholders like <email>, <order_id>
-                        if 'original' in item and isinstance(item['original'], list):
-                            texts = []
-                            for turn in item['original']:
-                                if isinstance(turn, list) and len(turn) > 1:
-                                    texts.append(str(turn[1]))
-                            conversation_text = " ".join(texts)
-                        
-                        # Fallback: try 'delexed' field (anonymized but better than nothing)
-                        elif 'delexed' in item and isinstance(item['delexed'], list):
-                            texts = []
-                            for turn in item['delexed']:
-                                if isinstance(turn, dict) and 'text' in turn:
-                                    texts.append(turn['text'])
-                            conversation_text = " ".join(texts)
+            if prepared or (isinstance(json_data, dict) and 'train' in json_data):
+                if not prepared:
+                    prepared = prepare_abcd_conversations(json_data['train'])
+                
+                # First extract from conversation text (all conversations at once)
+                extraction_results = await extract_many(
+                    [text for _, _, text in prepared],
+                    [f"{request.fileName or 'abcd'}_convo_{item.get('convo_id', idx)}" for idx, item, _ in prepared]
+                )
+                
+                for (idx, item, conversation_text), extraction_result in zip(prepared, extraction_results):
+                    convo_id = item.get('convo_id', idx)
+                    metadata = extraction_result['metadata']
+                    scenario = item.get('scenario')
+                    
+                    # Add conversation ID to metadata
+                    metadata['conversation_id'] = convo_id
+                    metadata['has_scenario_data'] = 'scenario' in item
+                    
+                    # ALSO extract from scenario field (has customer info like phone, zip, order_id)
+                    if isinstance(scenario, dict):
+                        # Extract from personal info
+                        if 'personal' in scenario:
+                            personal = scenario['personal']
+                            if extraction_result['phone'] == 'NA' and personal.get('phone'):
+                                extraction_result['phone'] = personal['phone']
+                            if extraction_result['email'] == 'NA' and personal.get('email'):
+                                extraction_result['email'] = personal['email']
                         
-                        # Fallback: try 'scenario' field (has structured data)
-                        elif 'scenario' in item:
-                            conversation_text = str(item['scenario'])
+                        # Extract from order info
+                        if 'order' in scenario:
+                            order = scenario['order']
+                            if extraction_result['zipCode'] == 'NA' and order.get('zip_code'):
+                                extraction_result['zipCode'] = order['zip_code']
+                            if extraction_result['orderId'] == 'NA' and order.get('order_id'):
+                                extraction_result['orderId'] = order['order_id']
                         
-                        if conversation_text.strip():
-                            convo_id = item.get('convo_id', idx)
-                            
-                            # First extract from conversation text
-                            extraction_result = await extract_single_conversation(
-                                conversation_text,
-                                f"{request.fileName or 'abcd'}_convo_{convo_id}"
-                            )
-                            
-                            # ALSO extract from scenario field (has customer info like phone, zip, order_id)
-                            if 'scenario' in item and isinstance(item['scenario'], dict):
-                                scenario = item['scenario']
-                                
-                                # Extract from personal info
-                                if 'personal' in scenario:
-                                    personal = scenario['personal']
-                                    if extraction_result['phone'] == 'NA' and personal.get('phone'):
-                                        extraction_result['phone'] = personal['phone']
-                                    if extraction_result['email'] == 'NA' and personal.get('email'):
-                                        extraction_result['email'] = personal['email']
-                                
-                                # Extract from order info
-                                if 'order' in scenario:
-                                    order = scenario['order']
-                                    if extraction_result['zipCode'] == 'NA' and order.get('zip_code'):
-                                        extraction_result['zipCode'] = order['zip_code']
-                                    if extraction_result['orderId'] == 'NA' and order.get('order_id'):
-                                        extraction_result['orderId'] = order['order_id']
-                            
-                            # Add conversation ID and category info to metadata
-                            extraction_result['metadata']['conversation_id'] = convo_id
-                            extraction_result['metadata']['has_scenario_data'] = 'scenario' in item
-                            
-                            # Add flow/subflow for conversation categorization
-                            if 'scenario' in item and isinstance(item['scenario'], dict):
-                                scenario = item['scenario']
-                                extraction_result['metadata']['flow'] = scenario.get('flow', 'unknown')
-                                extraction_result['metadata']['subflow'] = scenario.get('subflow', '')
-                                # Create a human-readable category
-                                flow = scenario.get('flow', '').replace('_', ' ').title()
-                                subflow = scenario.get('subflow', '').replace('_', ' ').title()
-                                extraction_result['metadata']['category'] = f"{flow}" if not subflow else f"{flow} - {subflow}"
-                            
-                            results.append(extraction_result)
+                        # Add flow/subflow for conversation categorization
+                        metadata['flow'] = scenario.get('flow', 'unknown')
+                        metadata['subflow'] = scenario.get('subflow', '')
+                        # Create a human-readable category
+                        flow = _humanize(scenario.get('flow', ''))
+                        subflow = _humanize(scenario.get('subflow', ''))
+                        metadata['category'] = f"{flow}" if not subflow else f"{flow} - {subflow}"
+                    
+                    results.append(extraction_result)
                 
                 if results:
                     # Create summary of conversation types
-                    categories = {}
-                    for r in results:
-                        cat = r.get('metadata', {}).get('flow', 'unknown')
-                        categories[cat] = categories.get(cat, 0) + 1
+                    categories = Counter(r['metadata'].get('flow', 'unknown') for r in results)
                     
                     # Create a descriptive summary
                     summary = ", ".join([f"{v} {k.replace('_', ' ')}" for k, v in categories.items()])
                     
-                    return {
+                    content = {
                         "conversations": results, 
                         "total": len(results), 
                         "format": "abcd", 
@@ -925,9 +1381,16 @@ async def extract_bulk(request: ExtractRequest):
                         "summary": summary,
                         "categories": categories
                     }
+                    try:
+                        return ORJSONResponse(content)
+                    except orjson.JSONEncodeError:
+                        # Values copied from the upload (e.g. a convo_id wider
+                        # than 64 bits) that only the json module can encode
+                        return JSONResponse(content)
             
             # Handle JSON array format
             if isinstance(json_data, list):
+                prepared = []
                 for idx, item in enumerate(json_data):
                     conversation_text = ""
                     if isinstance(item, dict):
@@ -944,28 +1407,32 @@ async def extract_bulk(request: ExtractRequest):
                         conversation_text = str(item)
                     
                     if conversation_text.strip():
-                        extraction_result = await extract_single_conversation(
-                            conversation_text,
-                            f"{request.fileName or 'bulk'}_conversation_{idx+1}"
-                        )
-                        results.append(extraction_result)
+                        prepared.append((idx, conversation_text))
+                
+                results = await extract_many(
+                    [text for _, text in prepared],
+                    [f"{request.fileName or 'bulk'}_conversation_{idx+1}" for idx, _ in prepared]
+                )
                 
                 if results:
-                    return {"conversations": results, "total": len(results), "format": "json"}
+                    return ORJSONResponse({"conversations": results, "total": len(results), "format": "json"})
         except json.JSONDecodeError:
             pass
         
-        # Check if it's JSONL format (JSON Lines - one JSON object per line)
-        if '\n' in text:
-            lines = text.split('\n')
-            json_lines = [line.strip() for line in lines if line.strip()]
-            
-            # Try to parse as JSONL
+        # Check if it's JSONL format (JSON Lines - one JSON object per line).
+        # The first line is parsed on its own first, so plain text is rejected
+        # without splitting and stripping every line
+        if '\n' in text and _parses_as_json(text[:text.find('\n')].strip()):
+            # Try to parse as JSONL, reading lines one at a time (StringIO
+            # splits on '\n' only) rather than building lists of all of them
             jsonl_parsed = True
             jsonl_data = []
-            for line in json_lines:
+            for line in io.StringIO(text):
+                line = line.strip()
+                if not line:
+                    continue
                 try:
-                    data = json.loads(line)
+                    data = _loads_json(line)
                     jsonl_data.append(data)
                 except json.JSONDecodeError:
                     jsonl_parsed = False
@@ -973,6 +1440,7 @@ async def extract_bulk(request: ExtractRequest):
             
             if jsonl_parsed and jsonl_data:
                 # Process each JSON object as a separate conversation
+                prepared = []
                 for idx, item in enumerate(jsonl_data):
                     # Extract text from the JSON object
                     conversation_text = ""
@@ -993,51 +1461,53 @@ async def extract_bulk(request: ExtractRequest):
                         conversation_text = str(item)
                     
                     if conversation_text.strip():
-                        # Extract fields from this conversation
-                        extraction_result = await extract_single_conversation(
-                            conversation_text,
-                            f"{request.fileName or 'bulk'}_conversation_{idx+1}"
-                        )
-                        results.append(extraction_result)
+                        prepared.append((idx, conversation_text))
+                
+                # Extract fields from each conversation
+                results = await extract_many(
+                    [text for _, text in prepared],
+                    [f"{request.fileName or 'bulk'}_conversation_{idx+1}" for idx, _ in prepared]
+                )
                 
                 if results:
-                    return {"conversations": results, "total": len(results), "format": "jsonl"}
+                    return ORJSONResponse({"conversations": results, "total": len(results), "format": "jsonl"})
         
         # If not JSON, treat entire text as single conversation
         result = await extract_single_conversation(text, request.fileName)
-        return {"conversations": [result], "total": 1, "format": "text"}
+        return ORJSONResponse({"conversations": [result], "total": 1, "format": "text"})
         
     except Exception as e:
         print(f"Bulk extraction error: {e}")
         raise HTTPException(status_code=400, detail=str(e))
 
-async def extract_single_conversation(text: str, file_name: Optional[str] = None):
+async def extract_single_conversation(
+    text: str,
+    file_name: Optional[str] = None,
+    regex_result: Optional[Dict[str, str]] = None,
+    processed_at: Optional[str] = None
+):
     """Extract fields from a single conversation"""
-    # Regex extraction
-    regex_result = regex_extract_fields(text)
+    # Regex extraction (bulk callers pass in results computed in batch)
+    if regex_result is None:
+        regex_result = regex_extract_cached(text)
     
-    # LLM extraction
+    # Module globals read once per call
+    llm_available = LLM_AVAILABLE
+    extractor = llm_extractor
+    
+    # LLM extraction, only for the fields regex missed
+    missing = [field for field in EXTRACTED_FIELDS if regex_result.get(field, "NA") == "NA"]
     llm_result = {}
-    if LLM_AVAILABLE and llm_extractor:
+    if llm_available and extractor and missing:
         try:
-            llm_result = await llm_extractor.extract_async(text)
+            llm_result = await extractor.extract_async(text, missing)
         except Exception as e:
             print(f"LLM extraction error: {e}")
             llm_result = {"email": "NA", "phone": "NA", "zipCode": "NA", "orderId": "NA"}
     
     # Combine results - use the best from each source
     # Priority: regex first (deterministic), then LLM as fallback
-    final_result = {}
-    for field in ["email", "phone", "zipCode", "orderId"]:
-        regex_val = regex_result.get(field, "NA")
-        llm_val = llm_result.get(field, "NA") if LLM_AVAILABLE else "NA"
-        
-        if regex_val != "NA":
-            final_result[field] = regex_val  # Prefer regex
-        elif llm_val != "NA":
-            final_result[field] = llm_val  # Fallback to LLM
-        else:
-            final_result[field] = "NA"
+    final_result = merge_extraction_results(regex_result, llm_result)
     
     # Customer name from regex only (LLM not trained for this yet)
     customer_name = regex_result.get("customerName", "NA")
@@ -1045,11 +1515,11 @@ async def extract_single_conversation(text: str, file_name: Optional[str] = None
     # Add metadata
     metadata = {
         "fileName": file_name,
-        "processedAt": datetime.now().isoformat(),
+        "processedAt": processed_at or datetime.now().isoformat(),
         "textLength": len(text),
-        "extractionMethod": "hybrid" if LLM_AVAILABLE else "regex",
+        "extractionMethod": "hybrid" if llm_available else "regex",
         "regexResults": regex_result,
-        "llmResults": llm_result if LLM_AVAILABLE else None
+        "llmResults": llm_result if llm_available else None
     }
     
     return {
@@ -1061,11 +1531,69 @@ async def extract_single_conversation(text: str, file_name: Optional[str] = None
         "metadata": metadata
     }
 
+async def extract_many(
+    texts: List[str],
+    file_names: List[Optional[str]],
+    processed_at: Optional[str] = None
+) -> List[Dict]:
+    """Extract fields from many conversations: regex in batch, LLM calls overlapped"""
+    regex_results = await regex_extract_many(texts)
+    # The whole batch shares one processedAt timestamp
+    processed_at = processed_at or datetime.now().isoformat()
+    
+    async def extract_bounded(text, file_name, regex_result):
+        async with _llm_semaphore:
+            return await extract_single_conversation(
+                text, file_name, regex_result=regex_result, processed_at=processed_at
+            )
+    
+    return await asyncio.gather(*(
+        extract_bounded(text, file_name, regex_result)
+        for text, file_name, regex_result in zip(texts, file_names, regex_results)
+    ))
+
+# Startup side effects run from lifespan() rather than at import: regex pool
+# workers re-import this module (as __mp_main__ when started with
+# `python main.py` under the spawn start method) and must not touch the
+# database or the LLM.
+def init_backend():
+    global llm_extractor, LLM_AVAILABLE, _write_conn
+    init_database()
+    
+    try:
+        llm_extractor = AsyncLLMExtractor()
+        LLM_AVAILABLE = True
+    except Exception as e:
+        print(f"LLM not available: {e}")
+    
+    # Opened after init_database() so the WAL index exists before any
+    # read-only connection
+    _write_conn = open_db_connection()
+
+def shutdown_regex_pool():
+    if _regex_pool is not None:
+        _regex_pool.shutdown(wait=False, cancel_futures=True)
+
+def close_db_connections():
+    while True:
+        try:
+            _read_pool.get_nowait().close()
+        except queue.Empty:
+            break
+    if _write_conn is None:
+        # Startup failed before the write connection was opened
+        return
+    with _write_lock:
+        # Refresh planner statistics for the indexes before closing
+        _write_conn.execute("PRAGMA optimize")
+        _write_conn.close()
+
 @app.get("/health")
 async def health_check():
     return {
         "status": "healthy",
         "llm_available": LLM_AVAILABLE,
+        "regex_engine": "re2" if USE_RE2 else "re",
         "database": "connected",
         "timestamp": datetime.now().isoformat()
     }
@@ -4,25 +4,57 @@ Script to create test files from the ABCD dataset
 """
 import json
 import sys
+from itertools import islice
+
+# Optional streaming parser: reads only the conversations we keep
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Optional fast JSON encoder for writing the samples
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def write_json(filename, data):
+    """Write data as 2-space indented JSON"""
+    if ORJSON_AVAILABLE:
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(filename, 'w') as f:
+            json.dump(data, f, indent=2)
 
 def create_test_samples():
     """Create smaller test files from the ABCD dataset"""
     
-    # Load the full ABCD dataset
-    print("Loading ABCD dataset...")
-    with open('abcd_v1.1.json', 'r') as f:
-        data = json.load(f)
-    
-    conversations = data.get('train', [])
-    total = len(conversations)
-    print(f"Total conversations: {total}")
-    
     # Create sample sizes
     samples = {
         'abcd_sample_10.json': 10,
         'abcd_sample_50.json': 50,
         'abcd_sample_100.json': 100,
     }
+    max_count = max(samples.values())
+    
+    if IJSON_AVAILABLE:
+        # Stream just the first conversations instead of parsing the whole dataset
+        print(f"Reading the first {max_count} ABCD conversations...")
+        with open('abcd_v1.1.json', 'rb') as f:
+            conversations = list(islice(ijson.items(f, 'train.item', use_float=True), max_count))
+        print(f"Read {len(conversations)} conversations")
+    else:
+        # Load the full ABCD dataset
+        print("Loading ABCD dataset (pip install ijson to stream it instead)...")
+        with open('abcd_v1.1.json', 'r') as f:
+            data = json.load(f)
+        
+        conversations = data.get('train', [])
+        total = len(conversations)
+        print(f"Total conversations: {total}")
     
     for filename, count in samples.items():
         sample_data = {
@@ -34,8 +66,7 @@ def create_test_samples():
             }
         }
         
-        with open(filename, 'w') as f:
-            json.dump(sample_data, f, indent=2)
+        write_json(filename, sample_data)
         
         print(f"✓ Created {filename} with {count} conversations")
     
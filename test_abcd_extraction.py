@@ -6,43 +6,102 @@ import json
 import requests
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 
 BACKEND_URL = "http://localhost:8000"
 
-def test_abcd_extraction(file_path, num_conversations=None):
-    """Test the ABCD dataset extraction"""
+# One session for every request so connections to the backend are reused
+SESSION = requests.Session()
+SESSION.mount('http://', HTTPAdapter(pool_connections=10, pool_maxsize=10))
+
+def _json_string_body(text):
+    """Escape text for inclusion inside a JSON string literal"""
+    return json.dumps(text)[1:-1].encode()
+
+def stream_request_body(conversations, file_name):
+    """Yield the /extract-bulk request body one conversation at a time
+    
+    The endpoint takes the dataset as a JSON string in "text", so each piece of
+    {"train": [...]} is escaped as it is produced instead of encoding the whole
+    dataset twice up front.
+    """
+    yield f'{{"fileName": {json.dumps(file_name)}, "text": "'.encode()
+    yield _json_string_body('{"train": [')
+    for i, conversation in enumerate(conversations):
+        yield _json_string_body((', ' if i else '') + json.dumps(conversation))
+    yield _json_string_body(']}')
+    yield b'"}'
+
+def stream_file_body(file_path, file_name, chunk_size=64 * 1024):
+    """Yield the /extract-bulk request body with the file's own text in "text"
+    
+    Used when the whole file is sent, so the dataset is never parsed and
+    re-encoded; only the string escaping is applied, chunk by chunk.
+    """
+    yield f'{{"fileName": {json.dumps(file_name)}, "text": "'.encode()
+    with open(file_path, 'r') as f:
+        while chunk := f.read(chunk_size):
+            yield _json_string_body(chunk)
+    yield b'"}'
+
+def load_conversations(file_path):
+    """Load the list of conversations from a sample file"""
+    with open(file_path, 'r') as f:
+        data = json.load(f)
+    return data.get('train', data if isinstance(data, list) else [])
+
+def send_for_extraction(file_path, num_conversations=None, conversations=None):
+    """Load a sample file and send its conversations to /extract-bulk
+    
+    When conversations are already loaded they are sent as-is and the file
+    is not opened; file_path then only names the upload. When the whole file
+    is wanted its text is uploaded unparsed.
+    Returns (number of conversations sent or None when the file was sent
+    unparsed, response, seconds the request took)
+    """
+    file_name = file_path.split('/')[-1]
+    if conversations is None and not num_conversations:
+        count, body = None, stream_file_body(file_path, file_name)
+    else:
+        if conversations is None:
+            conversations = load_conversations(file_path)
+        if num_conversations:
+            conversations = conversations[:num_conversations]
+        count, body = len(conversations), stream_request_body(conversations, file_name)
+    
+    start_time = time.time()
+    # A generator body is sent with chunked transfer encoding
+    response = SESSION.post(
+        f"{BACKEND_URL}/extract-bulk",
+        data=body,
+        headers={"Content-Type": "application/json"},
+        timeout=300  # 5 minute timeout
+    )
+    return count, response, time.time() - start_time
+
+def test_abcd_extraction(file_path, num_conversations=None, pending=None, conversations=None):
+    """Test the ABCD dataset extraction
+    
+    pending is a Future of send_for_extraction() already running in the
+    background; without it the file is sent here.
+    """
     
     print(f"\n📚 Testing ABCD Dataset Extraction")
     print(f"{'=' * 50}")
     print(f"File: {file_path}")
     
     try:
-        # Load the JSON file
-        print(f"Loading dataset...")
-        with open(file_path, 'r') as f:
-            data = json.load(f)
-        
-        # Get conversations
-        conversations = data.get('train', data if isinstance(data, list) else [])
-        if num_conversations:
-            conversations = conversations[:num_conversations]
-        
-        print(f"✓ Loaded {len(conversations)} conversations")
-        
-        # Prepare request
-        print(f"Sending to backend for extraction...")
-        start_time = time.time()
-        
-        response = requests.post(
-            f"{BACKEND_URL}/extract-bulk",
-            json={
-                "text": json.dumps({"train": conversations}),
-                "fileName": file_path.split('/')[-1]
-            },
-            timeout=300  # 5 minute timeout
-        )
+        print(f"Sending dataset to backend for extraction...")
+        if pending is None:
+            count, response, elapsed = send_for_extraction(file_path, num_conversations, conversations)
+        else:
+            count, response, elapsed = pending.result()
         
-        elapsed = time.time() - start_time
+        if count is None:
+            print(f"✓ Sent the whole file")
+        else:
+            print(f"✓ Sent {count} conversations")
         
         if response.status_code == 200:
             results = response.json()
@@ -98,7 +157,7 @@ def main():
     # Check backend health
     print(f"\n🔍 Checking backend at {BACKEND_URL}...")
     try:
-        health = requests.get(f"{BACKEND_URL}/health")
+        health = SESSION.get(f"{BACKEND_URL}/health")
         if health.status_code == 200:
             print(f"✓ Backend is healthy")
         else:
@@ -114,12 +173,29 @@ def main():
         ('sample-data/abcd_sample_50.json', 50),
     ]
     
-    for file_path, count in samples:
-        success = test_abcd_extraction(file_path)
-        if not success:
-            print(f"\n⚠️  Test failed, skipping larger samples")
-            break
-        print(f"\n{'=' * 50}\n")
+    # The smaller samples are prefixes of the largest one, so parse that
+    # file once and slice it for them; the largest is uploaded unparsed
+    try:
+        all_conversations = load_conversations(samples[-1][0])
+    except FileNotFoundError:
+        print(f"✗ File not found: {samples[-1][0]}")
+        return
+    
+    # Send every sample at once (the backend handles requests concurrently),
+    # then report the results in order
+    with ThreadPoolExecutor(max_workers=len(samples)) as executor:
+        pending = [executor.submit(send_for_extraction, file_path, conversations=all_conversations[:count])
+                   for file_path, count in samples[:-1]]
+        pending.append(executor.submit(send_for_extraction, samples[-1][0]))
+        for (file_path, count), future in zip(samples, pending):
+            success = test_abcd_extraction(file_path, pending=future)
+            if not success:
+                # Uploads still queued are dropped; ones already sent cannot be
+                # recalled, but their results are no longer reported
+                print(f"\n⚠️  Test failed, cancelling the remaining uploads")
+                executor.shutdown(wait=False, cancel_futures=True)
+                break
+            print(f"\n{'=' * 50}\n")
 
 if __name__ == '__main__':
     main()